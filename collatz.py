@@ -2,7 +2,63 @@
 from __future__ import annotations
 
 import argparse
-from typing import Iterable
+import sys
+from typing import Generator, Iterable, Iterator
+
+_STEP_FORMAT = "Step %2d: %d"
+_STEP_LINE = _STEP_FORMAT + "\n"
+_TAIL_CACHE_SIZE = 1 << 12
+_TAIL_CACHE: dict[int, tuple[int, ...]] = {1: ()}
+
+
+def _tail(start: int) -> tuple[int, ...]:
+    """Return the values that follow ``start`` down to 1.
+
+    ``start`` must be below ``_TAIL_CACHE_SIZE``, which keeps the memo
+    bounded. The memo is shared across calls in one process and stores only
+    ``start`` itself. A single call, such as one CLI run, therefore walks the
+    whole tail just as a plain loop would. Later calls that reach the same
+    value, or a value stored earlier, reuse the stored tail.
+    """
+
+    assert start < _TAIL_CACHE_SIZE, "only small values are cached"
+
+    tail = _TAIL_CACHE.get(start)
+    if tail is None:
+        prefix = []
+        current = start
+        while current not in _TAIL_CACHE:
+            current = current * 3 + 1 if current & 1 else current >> 1
+            prefix.append(current)
+        tail = _TAIL_CACHE[start] = (*prefix, *_TAIL_CACHE[current])
+    return tail
+
+
+def _check_start(start: int) -> None:
+    """Raise ``ValueError`` unless ``start`` is a positive integer."""
+
+    if start <= 0:
+        raise ValueError("start must be a positive integer")
+
+
+def _head(current: int) -> Generator[int, None, int]:
+    """Yield the values after ``current`` until one drops below the cache.
+
+    Returns:
+        The last value reached, whose remaining values come from ``_tail``.
+    """
+
+    while current >= _TAIL_CACHE_SIZE:
+        if not current & 1:
+            current >>= 1
+            yield current
+        else:
+            # 3n + 1 is always even for odd n, so take the halving step too.
+            current = current * 3 + 1
+            yield current
+            current >>= 1
+            yield current
+    return current
 
 
 def collatz_sequence(start: int) -> list[int]:
@@ -18,29 +74,46 @@ def collatz_sequence(start: int) -> list[int]:
         ValueError: If ``start`` is not a positive integer.
     """
 
-    if start <= 0:
-        raise ValueError("start must be a positive integer")
+    _check_start(start)
 
-    sequence = [start]
-    current = start
+    sequence = [start, *_head(start)]
+    sequence.extend(_tail(sequence[-1]))
+    return sequence
 
-    while current != 1:
-        if current % 2 == 0:
-            current //= 2
-        else:
-            current = current * 3 + 1
-        sequence.append(current)
 
-    return sequence
+def iter_collatz(start: int) -> Iterator[int]:
+    """Iterate over the Collatz sequence starting from ``start``.
+
+    Values are produced one at a time, so the whole sequence never has to be
+    held in memory.
+
+    Args:
+        start: Positive integer to begin the sequence.
+
+    Returns:
+        An iterator over each value in the progression until it reaches 1.
+
+    Raises:
+        ValueError: If ``start`` is not a positive integer.
+    """
+
+    _check_start(start)
+
+    return _iter_collatz(start)
+
+
+def _iter_collatz(current: int) -> Iterator[int]:
+    """Generate the sequence from an already validated start value."""
+
+    yield current
+    current = yield from _head(current)
+    yield from _tail(current)
 
 
 def format_sequence(sequence: Iterable[int]) -> str:
     """Format the sequence for human-friendly output."""
 
-    steps = []
-    for index, value in enumerate(sequence):
-        steps.append(f"Step {index:>2}: {value}")
-    return "\n".join(steps)
+    return "\n".join(_STEP_FORMAT % step for step in enumerate(sequence))
 
 
 def parse_args() -> argparse.Namespace:
@@ -61,8 +134,11 @@ def main() -> None:
     """Entrypoint for the script."""
 
     args = parse_args()
-    sequence = collatz_sequence(args.number)
-    print(format_sequence(sequence))
+    # Stream each line instead of building the whole sequence and text first.
+    sequence = iter_collatz(args.number)
+    sys.stdout.writelines(
+        _STEP_LINE % step for step in enumerate(sequence)
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+"""Tests for the Collatz sequence helpers."""
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+import collatz
+
+
+def _plain_sequence(start: int) -> list[int]:
+    sequence = [start]
+    while start != 1:
+        start = start // 2 if start % 2 == 0 else start * 3 + 1
+        sequence.append(start)
+    return sequence
+
+
+def test_tail_matches_plain_loop_near_cache_boundary() -> None:
+    limit = collatz._TAIL_CACHE_SIZE
+    for start in range(limit - 8, limit):
+        assert collatz._tail(start) == tuple(_plain_sequence(start)[1:])
+
+
+def test_sequence_matches_plain_loop_across_cache_boundary() -> None:
+    limit = collatz._TAIL_CACHE_SIZE
+    for start in [*range(1, 64), *range(limit - 8, limit + 8), 27**30]:
+        assert collatz.collatz_sequence(start) == _plain_sequence(start)
+        assert list(collatz.iter_collatz(start)) == _plain_sequence(start)
+
+
+def test_iter_collatz_rejects_non_positive_start_without_iterating() -> None:
+    with pytest.raises(ValueError):
+        collatz.iter_collatz(0)
+
+
+def test_main_prints_each_step(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(sys, "argv", ["collatz.py", "27"])
+
+    collatz.main()
+
+    output = capsys.readouterr().out
+    expected = "".join(
+        f"Step {index:>2}: {value}\n"
+        for index, value in enumerate(_plain_sequence(27))
+    )
+    assert output == expected
+    assert output.startswith("Step  0: 27\n")
+    assert output.endswith("Step 111: 1\n")
+
+
+def test_format_sequence_pads_step_numbers_and_has_no_trailing_newline() -> None:
+    assert collatz.format_sequence(range(8, 12)) == (
+        "Step  0: 8\nStep  1: 9\nStep  2: 10\nStep  3: 11"
+    )
+    assert collatz.format_sequence(range(11)).splitlines()[9:] == [
+        "Step  9: 9",
+        "Step 10: 10",
+    ]